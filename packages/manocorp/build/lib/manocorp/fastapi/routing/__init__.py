@@ -1 +0,0 @@
-from .apisecroute import SecFetchJsonRoute
@@ -1 +0,0 @@
-from .docker import DockerContainerDaemon  # noqa: F401, Used for side effects or dynamically
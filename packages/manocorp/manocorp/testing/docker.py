@@ -1,52 +1,80 @@
-import datetime
 import hashlib
 import secrets
 import socket
 import docker
 import logging
-from time import sleep
+from time import monotonic_ns, time
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+_CLIENT = None
+
+
+def _docker_client():
+    """
+    Return the shared Docker client, creating it on first use.
+
+    Every daemon and static method goes through the same client, so the
+    Unix-socket connection pool is shared instead of each call site
+    building its own client and session. Creation is deferred so merely
+    importing this module does not contact the Docker daemon.
+
+    Returns:
+        docker.DockerClient: The shared client.
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = docker.from_env()
+    return _CLIENT
+
 
 class DockerContainerDaemon:
     """
     A class representing a Docker container daemon.
 
     Attributes:
-        ports (list): A list of ports used by the Docker containers.
-        image_names (list): A list of image names used by the Docker containers.
-        tags (list): A list of tags used by the Docker containers.
-        container_names (list): A list of container names used by the
-                                Docker containers.
+        ports (set): The ports used by the Docker containers.
+        image_names (set): The image names used by the Docker containers.
+        tags (set): The tags used by the Docker containers.
+        container_names (set): The container names used by the
+                               Docker containers.
     """
 
-    ports = []
-    image_names = []
-    tags = []
-    container_names = []
+    # These registries are class-level on purpose: every daemon in the
+    # process shares them so ports and names are never handed out twice.
+    ports = set()
+    image_names = set()
+    tags = set()
+    container_names = set()
+    _seen_names = None
+    _image_cache = {}
 
     def _docker_build(self) -> bool:
         """
-        Execute a system command.
+        Build the Docker image for this daemon.
 
-        Args:
-            cmd (list): The command to be executed.
-            timeout (int): The timeout for the command execution
-                           (default is 5 seconds).
-            envs (dict): Additional environment variables for the command execution
-                         (default is an empty dictionary).
+        Identical builds are memoized across the session: the cache key is
+        the build context, the Dockerfile path and the Dockerfile content
+        hash, and a cache hit only re-tags the cached image under this
+        daemon's name instead of re-running the build.
 
         Returns:
-            bool: True if the command execution is successful, False otherwise.
+            bool: True if the image is available, False otherwise.
         """
-        image = self._client.images.build(
+        with open(self._dockerfile_path, "rb") as dockerfile:
+            content_hash = hashlib.sha256(dockerfile.read()).hexdigest()
+        key = (self._context, self._dockerfile_path, content_hash)
+        cached_id = DockerContainerDaemon._image_cache.get(key)
+        if cached_id:
+            return self._client.api.tag(cached_id, self._image_name, self._tag)
+        image, _ = self._client.images.build(
             path=self._context,
             tag=f"{self._image_name}:{self._tag}",
             dockerfile=self._dockerfile_path,
         )
         if image:
+            DockerContainerDaemon._image_cache[key] = image.id
             return True
         return False
 
@@ -66,6 +94,9 @@ class DockerContainerDaemon:
         """
         env = {
             "HOST": "0.0.0.0",  # nosec: B104
+            # Bind the app to the allocated port so the published port
+            # mapping below actually reaches it.
+            "PORT": self._port,
         }
         container = self._client.containers
         result = container.run(
@@ -74,6 +105,16 @@ class DockerContainerDaemon:
             detach=True,
             environment=env,
             ports={self._port: self._port},
+            # Probe sparingly during the short test window; the image
+            # default would fork a probe every 5 seconds. Durations are in
+            # nanoseconds per the Docker SDK.
+            healthcheck={
+                "test": ["CMD", "python", "-m", "docker_healthcheck"],
+                "interval": int(30e9),
+                "timeout": int(1e9),
+                "retries": 3,
+                "start_period": int(1e9),
+            },
         )
         if result:
             return True
@@ -81,16 +122,22 @@ class DockerContainerDaemon:
         return False
 
     def _docker_exec(self, cmd: list[str], envs: dict[str, str]) -> bool:
-        container = self._client.containers.get(self._container_name)
-        if container:
-            result = container.exec_run(cmd=" ".join(cmd), environment=envs)
-            if result and result.exit_code == 0:
-                return True
-            logger.error(
-                "Error executing the command: Container %s, Command %s",
-                container.name,
-                cmd,
-            )
+        # Passing the argv list straight to the low-level exec API lets the
+        # daemon exec the binary directly, without a shell re-splitting a
+        # joined command string.
+        exec_id = self._client.api.exec_create(
+            self._container_name,
+            cmd,
+            environment=envs,
+        )["Id"]
+        self._client.api.exec_start(exec_id)
+        if self._client.api.exec_inspect(exec_id)["ExitCode"] == 0:
+            return True
+        logger.error(
+            "Error executing the command: Container %s, Command %s",
+            self._container_name,
+            cmd,
+        )
         return False
 
     @staticmethod
@@ -101,56 +148,88 @@ class DockerContainerDaemon:
         Returns:
             str: The generated hash.
         """
-        rands = (
-            "DCD"
-            + "-".join([str(secrets.randbits(32)) for _ in range(10)])
-            + str(datetime.datetime.now())
-        )
-        return hashlib.sha256(rands.encode()).hexdigest()[:15]
+        h = hashlib.blake2b(secrets.token_bytes(40), digest_size=8)
+        h.update(monotonic_ns().to_bytes(8, "little"))
+        return h.hexdigest()[:15]
 
-    @staticmethod
-    def check_if_object_exists(name: str) -> bool:
+    @classmethod
+    def check_if_object_exists(cls, name: str) -> bool:
         """
         Check if a Docker object exists.
 
+        The daemon is queried only once to prime a cache of the existing
+        container and image names; subsequent calls are set lookups, so the
+        name-generation retry loops do not issue Docker API requests per
+        candidate.
+
         Args:
             name (str): The name of the Docker object.
 
         Returns:
             bool: True if the Docker object exists, False otherwise.
         """
-        try:
-            client = docker.from_env()
-            container = client.containers.list(all=True, filters={"name": name})
-            if container:
-                return True
-            image = client.images.list(filters={"reference": name})
-            if image:
-                return True
-        except docker.errors.APIError as e:
-            logger.error("Error checking if the object exists: %s", e)
-        return False
+        if cls._seen_names is None:
+            cls._seen_names = set()
+            try:
+                client = _docker_client()
+                for container in client.containers.list(all=True):
+                    cls._seen_names.add(container.name)
+                for image in client.images.list():
+                    for tag in image.tags:
+                        cls._seen_names.add(tag)
+                        cls._seen_names.add(tag.split(":")[0])
+            except docker.errors.APIError as e:
+                logger.error("Error listing the existing objects: %s", e)
+        return name in cls._seen_names
 
     @staticmethod
     def get_next_port():
         """
         Get the next available port.
 
+        The kernel hands out a free port through a bind to port 0, which
+        replaces the previous connect_ex sweep from port 5000 upwards (one
+        TCP connect attempt per candidate) with a single syscall. A draw
+        that collides with a port already reserved by another daemon is
+        simply retried.
+
         Returns:
             int: The next available port.
         """
-
-        def is_port_in_use(port):
+        port = 0
+        while port == 0 or port in DockerContainerDaemon.ports:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                return s.connect_ex(("localhost", port)) == 0
-
-        port = 5000
-        while port in DockerContainerDaemon.ports or is_port_in_use(port):
-            port = port + 1
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                s.bind(("", 0))
+                port = s.getsockname()[1]
 
-        DockerContainerDaemon.ports.append(port)
+        DockerContainerDaemon.ports.add(port)
         return port
 
+    @classmethod
+    def _get_next(cls, registry: set, check_daemon: bool = False) -> str:
+        """
+        Draw a hash-based name that is not already in the registry.
+
+        The three get_next_* name helpers share this loop; they only differ
+        in the registry they draw against.
+
+        Args:
+            registry (set): The registry of names already handed out.
+            check_daemon (bool): Also reject names of existing Docker
+                                 objects. Defaults to False.
+
+        Returns:
+            str: The next available name.
+        """
+        name = cls.get_hash()
+        while name in registry or (
+            check_daemon and cls.check_if_object_exists(name)
+        ):
+            name = cls.get_hash()
+        registry.add(name)
+        return name
+
     @staticmethod
     def get_next_image_name():
         """
@@ -159,14 +238,11 @@ class DockerContainerDaemon:
         Returns:
             str: The next available image name.
         """
-        image_name = DockerContainerDaemon.get_hash()
-        while (
-            image_name in DockerContainerDaemon.image_names
-            or DockerContainerDaemon.check_if_object_exists(image_name)
-        ):
-            image_name = DockerContainerDaemon.get_hash()
-
-        DockerContainerDaemon.image_names.append(image_name)
+        image_name = DockerContainerDaemon._get_next(
+            DockerContainerDaemon.image_names,
+            check_daemon=True,
+        )
+        DockerContainerDaemon._seen_names.add(image_name)
         return image_name
 
     @staticmethod
@@ -177,11 +253,7 @@ class DockerContainerDaemon:
         Returns:
             str: The next available tag.
         """
-        tag = DockerContainerDaemon.get_hash()
-        while tag in DockerContainerDaemon.tags:
-            tag = DockerContainerDaemon.get_hash()
-        DockerContainerDaemon.tags.append(tag)
-        return tag
+        return DockerContainerDaemon._get_next(DockerContainerDaemon.tags)
 
     @staticmethod
     def get_next_container_name():
@@ -191,11 +263,9 @@ class DockerContainerDaemon:
         Returns:
             str: The next available container name.
         """
-        container_name = DockerContainerDaemon.get_hash()
-        while container_name in DockerContainerDaemon.container_names:
-            container_name = DockerContainerDaemon.get_hash()
-        DockerContainerDaemon.container_names.append(container_name)
-        return container_name
+        return DockerContainerDaemon._get_next(
+            DockerContainerDaemon.container_names,
+        )
 
     def __init__(
         self,
@@ -205,7 +275,7 @@ class DockerContainerDaemon:
         context: str = ".",
         dockerfile_path: str = "./Dockerfile",
     ) -> None:
-        self._client = docker.from_env()
+        self._client = _docker_client()
         """
         Initialize a DockerContainerDaemon object.
 
@@ -261,19 +331,42 @@ class DockerContainerDaemon:
         """
         Check if the Docker container is running.
 
+        Waits on the daemon's event stream for this container's start event
+        instead of polling the status once per second, so the call returns
+        as soon as the daemon reports the container up. A container that
+        does not exist at all fails fast instead of waiting out the
+        deadline; the event wait only covers containers that are created
+        but not yet running.
+
         Returns:
             bool: True if the container is running, False otherwise.
         """
-        for i in range(1, 6):
-            try:
-                container = self._client.containers.get(self._container_name)
-                if container and container.status == "running":
-                    return True
-            except docker.errors.NotFound:
-                logger.error("Attempt #%s failed.", i)
-            sleep(1)
+        try:
+            container = self._client.containers.get(self._container_name)
+        except docker.errors.NotFound:
+            return False
+        if container.status == "running":
+            return True
+        events = self._client.events(
+            filters={"container": self._container_name, "event": "start"},
+            decode=True,
+            until=time() + 5,
+        )
+        for _ in events:
+            events.close()
+            return True
+        if self._has_status("running"):
+            return True
+        logger.error("Container %s is not running.", self._container_name)
         return False
 
+    def _has_status(self, status: str) -> bool:
+        try:
+            container = self._client.containers.get(self._container_name)
+            return container is not None and container.status == status
+        except docker.errors.NotFound:
+            return False
+
     def get_port(self):
         """
         Get the port of the Docker container.
@@ -297,6 +390,8 @@ class DockerContainerDaemon:
         """
         defaults = {
             "HOST": "0.0.0.0",  # nosec: B104
+            # Probe the port the app was started on, not the config default.
+            "PORT": self._port,
         }
         if env:
             env = defaults | env
@@ -1,14 +1,18 @@
 from time import sleep
-import requests
-import sys
+import random
+import socket
 import config
 
 
 def check_health(port: str = config.PORT, endpoint: str = "/health"):
     # skipcq: FLK-W505
     """
-    Check the health of a service by sending a GET request to the health
-    endpoint, inside the container.
+    Check the health of a service by sending a hand-crafted HTTP/1.0 GET
+    request to the health endpoint over a raw socket, inside the container.
+
+    A raw socket keeps the probe free of the `requests`/urllib3 import and
+    session setup cost, which matters because the container healthcheck
+    forks a fresh interpreter on every tick.
 
     Args:
         port (int): The port number on which the service is running.
@@ -19,24 +23,69 @@ def check_health(port: str = config.PORT, endpoint: str = "/health"):
               False otherwise.
     """
     url = f"{config.PROTOCOL}://{config.HOST}:{port}{endpoint}"
+    request = (
+        f"GET {endpoint} HTTP/1.0\r\nHost: {config.HOST}:{port}\r\n\r\n"
+    ).encode()
     retry = 0
     max_retries = 3
     while True:
         if retry >= max_retries:
             break
         try:
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
+            with socket.create_connection((config.HOST, int(port)), timeout=1) as s:
+                s.sendall(request)
+                data = s.recv(16)
+            if data.startswith(b"HTTP/1.1 200") or data.startswith(b"HTTP/1.0 200"):
                 print(f"Healthcheck passed: {url}")
                 return True
-        except requests.exceptions.ConnectionError as e:
+        except OSError as e:
             print(f"Attempt #{retry} failed: {url} {e}")
         retry = retry + 1
-        sleep(1)
+        # Exponential backoff with jitter, capped at the old flat 1 s wait.
+        sleep(min(0.05 * (2**retry), 1.0) + random.random() * 0.05)  # nosec: B311
+    print(f"Healthcheck failed: {url}")
+    return False
+
+
+async def check_health_async(port: str = config.PORT, endpoint: str = "/health"):
+    # skipcq: FLK-W505
+    """
+    Check the health of a service asynchronously, for callers that probe
+    several endpoints concurrently with asyncio.gather.
+
+    The aiohttp session lives inside the call so it is always bound to
+    the running event loop and closed on exit; concurrent probes each
+    open their own connection anyway. The aiohttp import is local so the
+    container healthcheck path never pays for it.
+
+    Args:
+        port (int): The port number on which the service is running.
+                    Defaults to config.PORT.
+
+    Returns:
+        bool: True if the healthcheck passes (status code 200),
+              False otherwise.
+    """
+    import aiohttp
+
+    url = f"{config.PROTOCOL}://{config.HOST}:{port}{endpoint}"
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(
+                url,
+                timeout=aiohttp.ClientTimeout(total=1),
+            ) as response:
+                if response.status == 200:
+                    print(f"Healthcheck passed: {url}")
+                    return True
+    except (aiohttp.ClientError, TimeoutError) as e:
+        print(f"Healthcheck attempt failed: {url} {e}")
     print(f"Healthcheck failed: {url}")
     return False
 
 
 # skipcq: TCV-001 - This is the main entry point of the application
 if __name__ == "__main__" and not check_health():
+    import sys
+
     sys.exit(1)
@@ -0,0 +1,10 @@
+import os
+
+# The user and healthcheck test fixtures create, seed and drop tables, which
+# is not safe against one shared database file when pytest-xdist workers run
+# them concurrently. Point each worker at its own SQLite file before config
+# reads DATABASE_URL.
+_worker = os.getenv("PYTEST_XDIST_WORKER")
+_database_url = os.getenv("DATABASE_URL", "")
+if _worker and _database_url.startswith("sqlite:///") and ":memory:" not in _database_url:
+    os.environ["DATABASE_URL"] = f"{_database_url}_{_worker}"
@@ -1,9 +1,13 @@
+import asyncio
 import pytest
-from docker_healthcheck import check_health
+from docker_healthcheck import check_health, check_health_async
 from manocorp.testing import DockerContainerDaemon
 
 
-@pytest.fixture
+# The healthcheck tests only read from the container, so one container
+# per session is enough instead of a full build/run/stop/remove cycle
+# per test.
+@pytest.fixture(scope="session")
 def docker_session():
     # Setup the test app.
     ds = DockerContainerDaemon()
@@ -109,3 +113,20 @@ def test_check_health_calling_the_module(docker_session: DockerContainerDaemon):
         None
     """
     assert docker_session.run(["python", "-m", "docker_healthcheck"])  # nosec: B101
+
+
+@pytest.mark.asyncio
+async def test_check_health_async(docker_session: DockerContainerDaemon):
+    """
+    Test the check_health_async function with several concurrent probes.
+
+    Args:
+        docker_session (DockerContainerDaemon): The Docker container session.
+
+    Returns:
+        None
+    """
+    results = await asyncio.gather(
+        *[check_health_async(docker_session.get_port()) for _ in range(3)],
+    )
+    assert all(results)  # nosec: B101